@@ -8,6 +8,7 @@ from app.api.deps import get_db, get_current_user
 from app.db.models import SnoreSession, SnoreClip
 from app.schemas.session import SessionCreateRes, SessionRes, ClipRes, FinalizeReq
 from app.services.advice import build_advice
+from app.services.timeline import SnoreTimeline
 from app.core.config import os
 from fastapi import Query
 from app.schemas.session import SessionListItem
@@ -48,6 +49,8 @@ def upload_clip(
         raise HTTPException(404, "session not found")
     if ss.status != "open":
         raise HTTPException(400, "session already finalized")
+    if end_sec < start_sec:
+        raise HTTPException(400, "end_sec must not be before start_sec")
 
     ext = Path(file.filename).suffix.lower()
     if ext not in [".wav", ".m4a", ".mp3"]:
@@ -60,19 +63,16 @@ def upload_clip(
 
     dur = max(1, int(math.ceil(end_sec - start_sec)))
     clip = SnoreClip(
-        session_id=session_id,
         file_path=str(path),
         start_sec=start_sec,
         end_sec=end_sec,
         duration_sec=dur,
         confidence=confidence
     )
-    db.add(clip)
+    ss.clips.append(clip)
 
-    # 세션 집계 갱신
-    ss.has_snore = True
-    ss.snore_count = (ss.snore_count or 0) + 1
-    ss.snore_total_sec = (ss.snore_total_sec or 0) + dur
+    # 세션 집계 갱신 (겹치는 클립은 병합된 구간 기준)
+    _apply_timeline(ss, SnoreTimeline.from_clips(ss.clips))
 
     db.commit(); db.refresh(clip)
 
@@ -81,32 +81,6 @@ def upload_clip(
         end_sec=clip.end_sec, duration_sec=clip.duration_sec, confidence=clip.confidence
     )
 
-@router.post("/{session_id}/finalize", response_model=SessionRes)
-def finalize_session(
-    session_id: int,
-    body: FinalizeReq,
-    db: Session = Depends(get_db),
-    user = Depends(get_current_user),
-):
-    ss = db.get(SnoreSession, session_id)
-    if not ss or ss.user_id != user.id:
-        raise HTTPException(404, "session not found")
-    if ss.status != "open":
-        raise HTTPException(400, "already finalized")
-
-    if body.started_at: ss.started_at = datetime.fromisoformat(body.started_at)
-    if body.ended_at:   ss.ended_at   = datetime.fromisoformat(body.ended_at)
-
-    if body.snore_count is not None: ss.snore_count = body.snore_count
-    if body.snore_total_sec is not None: ss.snore_total_sec = body.snore_total_sec
-    ss.has_snore = (ss.snore_count or 0) > 0
-
-    ss.advice = body.advice or build_advice(ss.snore_count or 0, ss.snore_total_sec or 0)
-    ss.status = "finalized"
-    db.commit(); db.refresh(ss)
-
-    return _to_session_res(ss)
-
 @router.get("/{session_id}", response_model=SessionRes)
 def get_session(session_id: int, db: Session = Depends(get_db), user = Depends(get_current_user)):
     ss = db.get(SnoreSession, session_id)
@@ -114,34 +88,11 @@ def get_session(session_id: int, db: Session = Depends(get_db), user = Depends(g
         raise HTTPException(404, "session not found")
     return _to_session_res(ss)
 
-def _to_session_res(ss: SnoreSession) -> SessionRes:
-    clips = [
-        ClipRes(
-            id=c.id, file_path=c.file_path, start_sec=c.start_sec,
-            end_sec=c.end_sec, duration_sec=c.duration_sec, confidence=c.confidence
-        ) for c in ss.clips
-    ]
-    return SessionRes(
-        id=ss.id, status=ss.status,
-        started_at=ss.started_at.isoformat() if ss.started_at else None,
-        ended_at=ss.ended_at.isoformat() if ss.ended_at else None,
-        has_snore=bool(ss.has_snore),
-        snore_count=ss.snore_count or 0,
-        snore_total_sec=ss.snore_total_sec or 0,
-        advice=ss.advice,
-        clips=clips
-    )
+def _apply_timeline(ss: SnoreSession, tl: SnoreTimeline) -> None:
+    ss.snore_count = tl.episode_count
+    ss.snore_total_sec = tl.total_sec
+    ss.has_snore = tl.episode_count > 0
 
-def _to_session_list_item(ss: SnoreSession) -> SessionListItem:
-    return SessionListItem(
-        id=ss.id,
-        started_at=ss.started_at.isoformat() if ss.started_at else None,
-        ended_at=ss.ended_at.isoformat() if ss.ended_at else None,
-        has_snore=bool(ss.has_snore),
-        snore_count=ss.snore_count or 0,
-        snore_total_sec=ss.snore_total_sec or 0,
-        advice=ss.advice
-    )
 @router.get("", response_model=list[SessionListItem])
 def list_sessions_by_date(
     date: str = Query(..., description="YYYY-MM-DD"),
@@ -228,7 +179,9 @@ def delete_clip(
     except Exception as e:
         print(f"[WARN] 파일 삭제 실패: {clip.file_path} ({e})")
 
-    db.delete(clip)
+    # 남은 클립 기준으로 집계 갱신 (확정된 세션 포함)
+    ss.clips.remove(clip)
+    _apply_timeline(ss, SnoreTimeline.from_clips(ss.clips))
     db.commit()
     return {"ok": True, "message": "Clip deleted."}
 
@@ -248,7 +201,8 @@ def finalize_session(
     if body.started_at: ss.started_at = datetime.fromisoformat(body.started_at)
     if body.ended_at:   ss.ended_at   = datetime.fromisoformat(body.ended_at)
 
-    # 집계 지정값 우선
+    # 집계: 지정값 우선, 없으면 병합된 타임라인 기준
+    _apply_timeline(ss, SnoreTimeline.from_clips(ss.clips))
     if body.snore_count is not None: ss.snore_count = body.snore_count
     if body.snore_total_sec is not None: ss.snore_total_sec = body.snore_total_sec
     ss.has_snore = (ss.snore_count or 0) > 0
@@ -309,6 +263,7 @@ def _to_session_res(ss: SnoreSession) -> SessionRes:
         advice=ss.advice,
         sleep_duration=ss.sleep_duration,
         sleep_quality=ss.sleep_quality,
+        snore_longest_sec=round(SnoreTimeline.from_clips(ss.clips).longest_sec, 1),
         clips=clips
     )
 
@@ -30,6 +30,7 @@ class SessionRes(BaseModel):
     advice: Optional[str] = None
     sleep_duration: Optional[float] = None  # 시간 단위
     sleep_quality: Optional[str] = None
+    snore_longest_sec: float = 0  # 가장 긴 코골이 에피소드(초)
     clips: List[ClipRes] = []
 
 class FinalizeReq(BaseModel):
@@ -0,0 +1,44 @@
+import math
+
+# 클립 최소 길이(초). duration_sec 의 max(1, ...) 와 동일하게 맞춘다.
+MIN_CLIP_SEC = 1.0
+
+class SnoreTimeline:
+    """
+    세션 내 코골이 클립 구간을 정렬 후 병합한 결과.
+    겹치거나 중복된 클립은 하나의 에피소드로 합쳐 실제 코골이 시간만 계산한다.
+    요청마다 세션 클립으로 새로 만들어 쓴다 (클립 n개 기준 O(n log n)).
+    """
+
+    def __init__(self, intervals=()):
+        self._episodes = []  # (start, end) - 서로 겹치지 않음, 시작 기준 정렬
+        for s, e in sorted(intervals):
+            if self._episodes and s <= self._episodes[-1][1]:
+                if e > self._episodes[-1][1]:
+                    self._episodes[-1] = (self._episodes[-1][0], e)
+            else:
+                self._episodes.append((s, e))
+
+    @classmethod
+    def from_clips(cls, clips) -> "SnoreTimeline":
+        return cls((c.start_sec, max(c.end_sec, c.start_sec + MIN_CLIP_SEC)) for c in clips)
+
+    @property
+    def covered_sec(self) -> float:
+        return sum(e - s for s, e in self._episodes)
+
+    @property
+    def total_sec(self) -> int:
+        """DB 컬럼(정수 초)용 총 코골이 시간."""
+        return max(0, int(math.ceil(self.covered_sec - 1e-9)))
+
+    @property
+    def episode_count(self) -> int:
+        return len(self._episodes)
+
+    @property
+    def longest_sec(self) -> float:
+        return max((e - s for s, e in self._episodes), default=0.0)
+
+    def episodes(self) -> list[tuple[float, float]]:
+        return list(self._episodes)
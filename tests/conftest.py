@@ -0,0 +1,25 @@
+import os
+import tempfile
+
+import pytest
+
+# app 모듈 임포트 전에 테스트용 DB/오디오 경로 지정
+_tmp = tempfile.mkdtemp(prefix="snore_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/test.db"
+os.environ["AUDIO_DIR"] = os.path.join(_tmp, "audio")
+
+
+@pytest.fixture
+def client():
+    from fastapi.testclient import TestClient
+    from app.main import app
+    return TestClient(app)
+
+
+@pytest.fixture
+def auth(client):
+    import uuid
+    email = f"u{uuid.uuid4().hex[:8]}@example.com"
+    client.post("/auth/register", json={"email": email, "password": "pw"})
+    tok = client.post("/auth/login", json={"email": email, "password": "pw"}).json()
+    return {"Authorization": f"Bearer {tok['access_token']}"}
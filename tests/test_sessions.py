@@ -0,0 +1,84 @@
+def _upload(client, auth, sid, start, end):
+    r = client.post(
+        f"/sessions/{sid}/clips/upload",
+        data={"start_sec": start, "end_sec": end},
+        files={"file": ("c.wav", b"RIFF", "audio/wav")},
+        headers=auth,
+    )
+    assert r.status_code == 200
+    return r.json()
+
+
+def _open_session(client, auth):
+    return client.post("/sessions", headers=auth).json()["id"]
+
+
+def test_overlapping_clips_use_merged_totals(client, auth):
+    sid = _open_session(client, auth)
+    _upload(client, auth, sid, 10, 20)
+    _upload(client, auth, sid, 10, 20)   # 중복
+    _upload(client, auth, sid, 15, 25)   # 겹침
+    _upload(client, auth, sid, 100, 104)
+
+    r = client.get(f"/sessions/{sid}", headers=auth).json()
+    assert r["snore_count"] == 2
+    assert r["snore_total_sec"] == 19
+    assert r["snore_longest_sec"] == 15
+
+    body = {"started_at": "2025-01-01T23:00:00", "ended_at": "2025-01-02T07:00:00"}
+    r = client.post(f"/sessions/{sid}/finalize", json=body, headers=auth).json()
+    assert r["status"] == "finalized"
+    assert r["snore_count"] == 2
+    assert r["snore_total_sec"] == 19
+    assert r["sleep_duration"] == 8.0
+    assert r["sleep_quality"] == "좋음"   # 19 / 28800 < 1%
+
+
+def test_delete_clip_updates_open_session(client, auth):
+    sid = _open_session(client, auth)
+    _upload(client, auth, sid, 0, 10)
+    mid = _upload(client, auth, sid, 5, 30)
+    _upload(client, auth, sid, 20, 40)
+
+    client.delete(f"/sessions/{sid}/clips/{mid['id']}", headers=auth)
+    r = client.get(f"/sessions/{sid}", headers=auth).json()
+    assert r["snore_count"] == 2
+    assert r["snore_total_sec"] == 30
+    assert r["snore_longest_sec"] == 20
+
+
+def test_delete_clip_updates_finalized_session(client, auth):
+    sid = _open_session(client, auth)
+    _upload(client, auth, sid, 0, 10)
+    last = _upload(client, auth, sid, 50, 80)
+    client.post(f"/sessions/{sid}/finalize", json={}, headers=auth)
+
+    client.delete(f"/sessions/{sid}/clips/{last['id']}", headers=auth)
+    r = client.get(f"/sessions/{sid}", headers=auth).json()
+    assert r["snore_count"] == 1
+    assert r["snore_total_sec"] == 10
+    assert r["snore_longest_sec"] == 10
+
+
+def test_zero_length_clip_counts_as_snore(client, auth):
+    sid = _open_session(client, auth)
+    clip = _upload(client, auth, sid, 10, 10)
+    assert clip["duration_sec"] == 1
+
+    r = client.post(f"/sessions/{sid}/finalize", json={}, headers=auth).json()
+    assert r["has_snore"] is True
+    assert r["snore_count"] == 1
+    assert r["snore_total_sec"] == 1
+    assert r["sleep_quality"] != "매우 좋음"
+
+
+def test_reversed_clip_is_rejected(client, auth):
+    sid = _open_session(client, auth)
+    r = client.post(
+        f"/sessions/{sid}/clips/upload",
+        data={"start_sec": 30, "end_sec": 20},
+        files={"file": ("c.wav", b"RIFF", "audio/wav")},
+        headers=auth,
+    )
+    assert r.status_code == 400
+    assert client.get(f"/sessions/{sid}", headers=auth).json()["clips"] == []
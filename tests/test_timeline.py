@@ -0,0 +1,59 @@
+import random
+from types import SimpleNamespace
+
+from app.services.timeline import SnoreTimeline
+
+
+def _clip(start, end):
+    return SimpleNamespace(start_sec=start, end_sec=end)
+
+
+def _brute(intervals):
+    merged = []
+    for s, e in sorted(intervals):
+        if merged and s <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], e)
+        else:
+            merged.append([s, e])
+    return [tuple(m) for m in merged]
+
+
+def test_overlap_and_duplicate_are_merged():
+    tl = SnoreTimeline([(10.0, 20.0), (10.0, 20.0), (15.0, 25.0), (40.0, 42.5)])
+    assert tl.episodes() == [(10.0, 25.0), (40.0, 42.5)]
+    assert tl.covered_sec == 17.5
+    assert tl.total_sec == 18
+    assert tl.episode_count == 2
+    assert tl.longest_sec == 15.0
+
+
+def test_touching_clips_form_one_episode():
+    tl = SnoreTimeline([(5.0, 8.0), (0.0, 5.0)])
+    assert tl.episodes() == [(0.0, 8.0)]
+
+
+def test_short_clips_count_at_least_one_second():
+    tl = SnoreTimeline.from_clips([_clip(3.0, 3.0), _clip(10.0, 10.2)])
+    assert tl.episodes() == [(3.0, 4.0), (10.0, 11.0)]
+    assert tl.total_sec == 2
+
+
+def test_empty():
+    tl = SnoreTimeline.from_clips([])
+    assert tl.episode_count == 0
+    assert tl.total_sec == 0
+    assert tl.longest_sec == 0
+
+
+def test_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(300):
+        intervals = []
+        for _ in range(rng.randint(0, 40)):
+            s = rng.randint(0, 50)
+            intervals.append((s, s + rng.randint(0, 8)))
+        expected = _brute(intervals)
+        tl = SnoreTimeline(intervals)
+        assert tl.episodes() == expected
+        assert tl.covered_sec == sum(e - s for s, e in expected)
+        assert tl.longest_sec == max((e - s for s, e in expected), default=0)